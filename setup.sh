@@ -119,6 +119,7 @@ Type=simple
 User=$USER
 Environment="CONFIG_PATH=$CONFIG_FILE"
 ExecStart=$BIN_DIR/$SERVICE_NAME
+ExecReload=/bin/kill -HUP \$MAINPID
 Restart=always
 RestartSec=10
 
@@ -8,13 +8,40 @@ import (
 	"fmt"
 	"io"
 	"log"
+	"math"
+	"math/rand"
 	"net/http"
 	"os"
 	"path/filepath"
 	"sort"
+	"sync"
 	"time"
 )
 
+// maxConcurrentDispatches limits the number of in-flight dispatch requests
+const maxConcurrentDispatches = 16
+
+// Branch represents a monitored IPA branch
+type Branch struct {
+	Name         string
+	IsTestflight bool
+}
+
+// monitoredBranches are the IPA branches that are checked for updates
+var monitoredBranches = []Branch{
+	{Name: "stable"},
+	{Name: "testflight", IsTestflight: true},
+}
+
+// Retry settings for failed branch checks
+const (
+	maxCheckAttempts = 4
+	retryBaseDelay   = 5 * time.Second
+	retryMaxDelay    = time.Minute
+	retryBackoff     = 1.3
+	retryJitter      = time.Second
+)
+
 // IPAFile represents an IPA file in the directory listing
 type IPAFile struct {
 	Name    string    `json:"name"`
@@ -31,6 +58,39 @@ type BranchHashes struct {
 type BranchData struct {
 	Hash      string              `json:"hash"`
 	Dispatches map[string][]string `json:"dispatches"`
+	// HTTP validators of the listing the stored hash was computed from
+	ETag         string `json:"etag,omitempty"`
+	LastModified string `json:"last_modified,omitempty"`
+}
+
+// dispatchPayload represents the body of a repository dispatch event
+type dispatchPayload struct {
+	EventType     string                `json:"event_type"`
+	ClientPayload dispatchClientPayload `json:"client_payload"`
+}
+
+// dispatchClientPayload represents the client payload sent to the workflows
+type dispatchClientPayload struct {
+	IPAURL       string `json:"ipa_url"`
+	IsTestflight bool   `json:"is_testflight"`
+}
+
+// dispatchTarget holds the request data of a target, built once per config
+type dispatchTarget struct {
+	repo          string
+	url           string
+	authorization string
+}
+
+// IPAListing represents a fetched branch directory listing
+type IPAListing struct {
+	URL          string
+	Body         []byte
+	Hash         string
+	ETag         string
+	LastModified string
+	// NotModified is set when the server answered 304 to a conditional request
+	NotModified bool
 }
 
 // DipaChecker is the main checker for IPA updates
@@ -39,23 +99,36 @@ type DipaChecker struct {
 	HashFile   string
 	BranchData BranchHashes
 	Client     *http.Client
+
+	// mu guards BranchData, the config derived fields and the hash
+	// file, branches are checked concurrently
+	mu sync.Mutex
+	// stopped is closed by Stop to cut retry waits short on shutdown
+	stopped  chan struct{}
+	stopOnce sync.Once
+	// branchLocks serialize checks of the same branch, checks can be
+	// triggered by the scheduler, SIGUSR1 and the webhook
+	branchLocks map[string]*sync.Mutex
+
+	// Request data derived from Config
+	branchURLs map[string]string
+	targets    []dispatchTarget
 }
 
 // NewChecker creates a new DipaChecker
 func NewChecker(cfg *Config) (*DipaChecker, error) {
+	// The hash directory is created by SaveHashes if it doesn't exist yet
 	hashDir := "/var/lib/dipa-auto"
-	if err := os.MkdirAll(hashDir, 0755); err != nil {
-		return nil, fmt.Errorf("failed to create hash directory: %w", err)
-	}
 
 	checker := &DipaChecker{
-		Config:   cfg,
 		HashFile: filepath.Join(hashDir, "branch_hashes.json"),
-		Client:   &http.Client{Timeout: 30 * time.Second},
+		Client:   newHTTPClient(),
 		BranchData: BranchHashes{
 			Branches: make(map[string]BranchData),
 		},
+		stopped: make(chan struct{}),
 	}
+	checker.applyConfig(cfg)
 
 	// Initialize the hash file (either load it or create it)
 	if err := checker.InitHashFile(); err != nil {
@@ -65,19 +138,41 @@ func NewChecker(cfg *Config) (*DipaChecker, error) {
 	return checker, nil
 }
 
+// applyConfig sets the configuration and precomputes the request data derived
+// from it, it is safe to call while checks are running
+func (c *DipaChecker) applyConfig(cfg *Config) {
+	branchURLs := make(map[string]string)
+	for _, branch := range monitoredBranches {
+		branchURLs[branch.Name] = fmt.Sprintf("%s/%s/", cfg.IPABaseURL, branch.Name)
+	}
+	
+	targets := make([]dispatchTarget, len(cfg.Targets))
+	for i, target := range cfg.Targets {
+		targets[i] = dispatchTarget{
+			repo:          target.GitHubRepo,
+			url:           fmt.Sprintf("https://api.github.com/repos/%s/dispatches", target.GitHubRepo),
+			authorization: fmt.Sprintf("Bearer %s", target.GitHubToken),
+		}
+	}
+	
+	c.mu.Lock()
+	c.Config = cfg
+	c.branchURLs = branchURLs
+	c.targets = targets
+	c.mu.Unlock()
+}
+
 // InitHashFile initializes the hash file - either loads existing one or creates new
 func (c *DipaChecker) InitHashFile() error {
 	// Check if the file exists
 	if _, err := os.Stat(c.HashFile); os.IsNotExist(err) {
 		// File doesn't exist, create a new one
 		log.Printf("Hash file not found, creating new one at %s", c.HashFile)
-		c.BranchData.Branches["stable"] = BranchData{
-			Hash:      "",
-			Dispatches: make(map[string][]string),
-		}
-		c.BranchData.Branches["testflight"] = BranchData{
-			Hash:      "",
-			Dispatches: make(map[string][]string),
+		for _, branch := range monitoredBranches {
+			c.BranchData.Branches[branch.Name] = BranchData{
+				Hash:      "",
+				Dispatches: make(map[string][]string),
+			}
 		}
 		
 		return c.SaveHashes()
@@ -89,18 +184,13 @@ func (c *DipaChecker) InitHashFile() error {
 		return fmt.Errorf("failed to load hash file: %w", err)
 	}
 	
-	// Make sure both branches exist
-	if _, ok := c.BranchData.Branches["stable"]; !ok {
-		c.BranchData.Branches["stable"] = BranchData{
-			Hash:      "",
-			Dispatches: make(map[string][]string),
-		}
-	}
-	
-	if _, ok := c.BranchData.Branches["testflight"]; !ok {
-		c.BranchData.Branches["testflight"] = BranchData{
-			Hash:      "",
-			Dispatches: make(map[string][]string),
+	// Make sure all branches exist
+	for _, branch := range monitoredBranches {
+		if _, ok := c.BranchData.Branches[branch.Name]; !ok {
+			c.BranchData.Branches[branch.Name] = BranchData{
+				Hash:      "",
+				Dispatches: make(map[string][]string),
+			}
 		}
 	}
 	
@@ -118,62 +208,129 @@ func (c *DipaChecker) LoadHashes() error {
 	return json.NewDecoder(file).Decode(&c.BranchData)
 }
 
-// SaveHashes saves the branch hashes to the hash file
+// SaveHashes saves the branch hashes to the hash file. The data is written to
+// a temporary file that is renamed over the hash file, so a crash mid-write
+// never leaves a truncated hash file behind.
 func (c *DipaChecker) SaveHashes() error {
-	file, err := os.Create(c.HashFile)
+	tmpFile := c.HashFile + ".tmp"
+	file, err := os.Create(tmpFile)
+	if os.IsNotExist(err) {
+		// Only create the hash directory when it is actually missing
+		if err := os.MkdirAll(filepath.Dir(c.HashFile), 0755); err != nil {
+			return fmt.Errorf("failed to create hash directory: %w", err)
+		}
+		file, err = os.Create(tmpFile)
+	}
 	if err != nil {
 		return err
 	}
-	defer file.Close()
 
-	encoder := json.NewEncoder(file)
-	encoder.SetIndent("", "  ")
-	return encoder.Encode(&c.BranchData)
+	// Compact JSON, same layout as the initial file written by setup.sh
+	if err := json.NewEncoder(file).Encode(&c.BranchData); err != nil {
+		file.Close()
+		os.Remove(tmpFile)
+		return err
+	}
+
+	// Make sure the data is on disk before it replaces the hash file
+	if err := syncFile(file); err != nil {
+		file.Close()
+		os.Remove(tmpFile)
+		return err
+	}
+
+	if err := file.Close(); err != nil {
+		os.Remove(tmpFile)
+		return err
+	}
+
+	return os.Rename(tmpFile, c.HashFile)
 }
 
-// FetchIPAList fetches the IPA list for a branch and calculates its hash
-func (c *DipaChecker) FetchIPAList(branch string) ([]IPAFile, string, error) {
-	url := fmt.Sprintf("%s/%s/", c.Config.IPABaseURL, branch)
+// FetchIPAList fetches the IPA list for a branch and calculates its hash.
+// The stored validators of the branch are sent along so an unchanged listing
+// is answered with 304 Not Modified and no body.
+func (c *DipaChecker) FetchIPAList(branch string, cached BranchData) (*IPAListing, error) {
+	c.mu.Lock()
+	url, ok := c.branchURLs[branch]
+	if !ok {
+		url = fmt.Sprintf("%s/%s/", c.Config.IPABaseURL, branch)
+	}
+	c.mu.Unlock()
 	
 	req, err := http.NewRequest("GET", url, nil)
 	if err != nil {
-		return nil, "", err
+		return nil, err
 	}
 	
 	req.Header.Set("Accept", "application/json")
+	if cached.ETag != "" {
+		req.Header.Set("If-None-Match", cached.ETag)
+	}
+	if cached.LastModified != "" {
+		req.Header.Set("If-Modified-Since", cached.LastModified)
+	}
 	
 	resp, err := c.Client.Do(req)
 	if err != nil {
-		return nil, "", err
+		return nil, err
 	}
 	defer resp.Body.Close()
 	
+	if resp.StatusCode == http.StatusNotModified {
+		return &IPAListing{
+			URL:          url,
+			Hash:         cached.Hash,
+			ETag:         cached.ETag,
+			LastModified: cached.LastModified,
+			NotModified:  true,
+		}, nil
+	}
+	
 	if resp.StatusCode != http.StatusOK {
-		return nil, "", fmt.Errorf("unexpected status code: %d", resp.StatusCode)
+		return nil, fmt.Errorf("unexpected status code: %d", resp.StatusCode)
 	}
 	
-	body, err := io.ReadAll(resp.Body)
+	// Hash the raw body while it is received, the server output is
+	// deterministic per version so the listing only has to be decoded once
+	// it actually changed.
+	// crypto/sha256 uses the SHA-NI / ARMv8 SHA2 instructions when available,
+	// and keeping it avoids invalidating every stored hash.
+	hasher := sha256.New()
+	body, err := io.ReadAll(io.TeeReader(resp.Body, hasher))
 	if err != nil {
-		return nil, "", err
+		return nil, err
 	}
+	hash := hex.EncodeToString(hasher.Sum(nil))
 	
+	return &IPAListing{
+		URL:          url,
+		Body:         body,
+		Hash:         hash,
+		ETag:         resp.Header.Get("ETag"),
+		LastModified: resp.Header.Get("Last-Modified"),
+	}, nil
+}
+
+// Files decodes the IPA files of the listing
+func (l *IPAListing) Files() ([]IPAFile, error) {
 	var files []IPAFile
-	if err := json.Unmarshal(body, &files); err != nil {
-		return nil, "", err
+	if err := json.Unmarshal(l.Body, &files); err != nil {
+		return nil, err
 	}
-	
-	// Sort the data to ensure consistent hashing
+	return files, nil
+}
+
+// legacyListingHash calculates the hash format used before listings were
+// hashed as raw bytes, it is only used to migrate stored hashes
+func legacyListingHash(files []IPAFile) (string, error) {
 	sortedData, err := sortAndMarshal(files)
 	if err != nil {
-		return nil, "", err
+		return "", err
 	}
 	
-	// Calculate hash
-	hasher := sha256.New()
-	hasher.Write(sortedData)
-	hash := hex.EncodeToString(hasher.Sum(nil))
-	
-	return files, hash, nil
+	sum := sha256.Sum256(sortedData)
+	return hex.EncodeToString(sum[:]), nil
 }
 
 // sortAndMarshal sorts the IPA files and marshals them to JSON
@@ -192,23 +349,27 @@ func (c *DipaChecker) GetLatestVersion(files []IPAFile) *IPAFile {
 		return nil
 	}
 	
-	latest := files[0]
-	for _, file := range files[1:] {
-		if file.ModTime.After(latest.ModTime) {
-			latest = file
+	// Track the index instead of copying every entry while scanning
+	latest := 0
+	for i := 1; i < len(files); i++ {
+		if files[i].ModTime.After(files[latest].ModTime) {
+			latest = i
 		}
 	}
 	
-	return &latest
+	return &files[latest]
 }
 
 // DispatchGitHubWorkflow dispatches a GitHub workflow for an IPA update
-func (c *DipaChecker) DispatchGitHubWorkflow(ipaURL, branch, currentHash string) ([]string, []string, error) {
+func (c *DipaChecker) DispatchGitHubWorkflow(ipaURL, branch string, isTestflight bool, currentHash string) ([]string, []string, error) {
 	successfulDispatches := []string{}
 	failedDispatches := []string{}
 	
 	// Get branch data
+	c.mu.Lock()
 	branchData, ok := c.BranchData.Branches[branch]
+	targets := c.targets
+	c.mu.Unlock()
 	if !ok {
 		branchData = BranchData{
 			Hash:      "",
@@ -217,86 +378,106 @@ func (c *DipaChecker) DispatchGitHubWorkflow(ipaURL, branch, currentHash string)
 	}
 	
 	// Get dispatches for current hash
-	dispatches, ok := branchData.Dispatches[currentHash]
-	if !ok {
-		dispatches = []string{}
+	dispatched := make(map[string]bool, len(branchData.Dispatches[currentHash]))
+	for _, repo := range branchData.Dispatches[currentHash] {
+		dispatched[repo] = true
+	}
+	
+	// Prepare dispatch payload, it is the same for every target
+	payload := dispatchPayload{
+		EventType: "ipa-update",
+		ClientPayload: dispatchClientPayload{
+			IPAURL:       ipaURL,
+			IsTestflight: isTestflight,
+		},
+	}
+	
+	payloadBytes, err := json.Marshal(payload)
+	if err != nil {
+		return nil, nil, fmt.Errorf("error marshaling payload: %w", err)
 	}
 	
-	for _, target := range c.Config.Targets {
-		repo := target.GitHubRepo
+	// Dispatch to all pending targets concurrently, each goroutine only
+	// writes its own slot so results keep the configured target order
+	results := make([]bool, len(targets))
+	pending := make([]bool, len(targets))
+	sem := make(chan struct{}, maxConcurrentDispatches)
+	var wg sync.WaitGroup
+	
+	for i, target := range targets {
+		repo := target.repo
 		
 		// Skip if already successfully dispatched for this hash
-		alreadyDispatched := false
-		for _, dispatched := range dispatches {
-			if dispatched == repo {
-				alreadyDispatched = true
-				break
-			}
-		}
-		
-		if alreadyDispatched {
+		if dispatched[repo] {
 			log.Printf("Skipping %s for %s - already dispatched for current version", repo, branch)
 			successfulDispatches = append(successfulDispatches, repo)
 			continue
 		}
 		
-		log.Printf("Dispatching workflow for %s update %s to %s", branch, ipaURL, repo)
-		
-		// Prepare dispatch payload
-		payload := map[string]interface{}{
-			"event_type": "ipa-update",
-			"client_payload": map[string]interface{}{
-				"ipa_url":      ipaURL,
-				"is_testflight": branch == "testflight",
-			},
-		}
-		
-		payloadBytes, err := json.Marshal(payload)
-		if err != nil {
-			log.Printf("Error marshaling payload for %s: %v", repo, err)
-			failedDispatches = append(failedDispatches, repo)
-			continue
-		}
-		
-		// Create request
-		url := fmt.Sprintf("https://api.github.com/repos/%s/dispatches", repo)
-		req, err := http.NewRequest("POST", url, bytes.NewBuffer(payloadBytes))
-		if err != nil {
-			log.Printf("Error creating request for %s: %v", repo, err)
-			failedDispatches = append(failedDispatches, repo)
-			continue
-		}
-		
-		// Set headers
-		req.Header.Set("Accept", "application/vnd.github+json")
-		req.Header.Set("Authorization", fmt.Sprintf("Bearer %s", target.GitHubToken))
-		req.Header.Set("Content-Type", "application/json")
-		
-		// Send request
-		resp, err := c.Client.Do(req)
-		if err != nil {
-			log.Printf("Error sending request to %s: %v", repo, err)
-			failedDispatches = append(failedDispatches, repo)
+		pending[i] = true
+		wg.Add(1)
+		go func(i int, target dispatchTarget) {
+			defer wg.Done()
+			sem <- struct{}{}
+			defer func() { <-sem }()
+			results[i] = c.dispatchToTarget(target, payloadBytes, ipaURL, branch)
+		}(i, target)
+	}
+	
+	wg.Wait()
+	
+	for i, target := range targets {
+		if !pending[i] {
 			continue
 		}
-		
-		// Check response
-		if resp.StatusCode != http.StatusNoContent {
-			body, _ := io.ReadAll(resp.Body)
-			log.Printf("Failed to dispatch %s workflow to %s: Status %d, Details: %s", 
-				branch, repo, resp.StatusCode, trimString(string(body), 200))
-			failedDispatches = append(failedDispatches, repo)
+		if results[i] {
+			successfulDispatches = append(successfulDispatches, target.repo)
 		} else {
-			log.Printf("Successfully dispatched %s workflow to %s", branch, repo)
-			successfulDispatches = append(successfulDispatches, repo)
+			failedDispatches = append(failedDispatches, target.repo)
 		}
-		
-		resp.Body.Close()
 	}
 	
 	return successfulDispatches, failedDispatches, nil
 }
 
+// dispatchToTarget sends a repository dispatch event to a single target
+func (c *DipaChecker) dispatchToTarget(target dispatchTarget, payload []byte, ipaURL, branch string) bool {
+	repo := target.repo
+	
+	log.Printf("Dispatching workflow for %s update %s to %s", branch, ipaURL, repo)
+	
+	// Create request
+	req, err := http.NewRequest("POST", target.url, bytes.NewReader(payload))
+	if err != nil {
+		log.Printf("Error creating request for %s: %v", repo, err)
+		return false
+	}
+	
+	// Set headers
+	req.Header.Set("Accept", "application/vnd.github+json")
+	req.Header.Set("Authorization", target.authorization)
+	req.Header.Set("Content-Type", "application/json")
+	
+	// Send request
+	resp, err := c.Client.Do(req)
+	if err != nil {
+		log.Printf("Error sending request to %s: %v", repo, err)
+		return false
+	}
+	defer resp.Body.Close()
+	
+	// Check response
+	if resp.StatusCode != http.StatusNoContent {
+		body, _ := io.ReadAll(resp.Body)
+		log.Printf("Failed to dispatch %s workflow to %s: Status %d, Details: %s", 
+			branch, repo, resp.StatusCode, trimString(string(body), 200))
+		return false
+	}
+	
+	log.Printf("Successfully dispatched %s workflow to %s", branch, repo)
+	return true
+}
+
 // trimString trims a string to the specified length
 func trimString(s string, maxLen int) string {
 	if len(s) <= maxLen {
@@ -305,17 +486,71 @@ func trimString(s string, maxLen int) string {
 	return s[:maxLen]
 }
 
-// CheckBranch checks a branch for updates
-func (c *DipaChecker) CheckBranch(branch string) error {
-	log.Printf("Checking %s branch...", branch)
+// Stop makes running and future retry waits return immediately
+func (c *DipaChecker) Stop() {
+	c.stopOnce.Do(func() { close(c.stopped) })
+}
+
+// CheckBranchWithRetry checks a branch for updates, retrying failed checks
+// with exponential backoff so a transient error doesn't wait for the next run.
+// The backoff starts over on every call, each run retries from the base delay.
+func (c *DipaChecker) CheckBranchWithRetry(branch string, isTestflight bool) error {
+	for attempt := 1; ; attempt++ {
+		err := c.CheckBranch(branch, isTestflight)
+		if err == nil || attempt >= maxCheckAttempts {
+			return err
+		}
+		
+		delay := retryDelay(attempt)
+		log.Printf("Error checking %s branch: %v, retrying in %s", branch, err, delay.Round(time.Second))
+		
+		timer := time.NewTimer(delay)
+		select {
+		case <-c.stopped:
+			timer.Stop()
+			return err
+		case <-timer.C:
+		}
+	}
+}
+
+// retryDelay returns the backoff delay after the given number of consecutive failures
+func retryDelay(failures int) time.Duration {
+	delay := math.Min(
+		float64(retryBaseDelay)*math.Pow(retryBackoff, float64(failures-1)),
+		float64(retryMaxDelay),
+	)
+	return time.Duration(delay) + time.Duration(rand.Int63n(int64(retryJitter)))
+}
+
+// branchLock returns the lock serializing checks of a branch
+func (c *DipaChecker) branchLock(branch string) *sync.Mutex {
+	c.mu.Lock()
+	defer c.mu.Unlock()
 	
-	files, currentHash, err := c.FetchIPAList(branch)
-	if err != nil {
-		return fmt.Errorf("error fetching IPA list: %w", err)
+	if c.branchLocks == nil {
+		c.branchLocks = make(map[string]*sync.Mutex)
+	}
+	lock, ok := c.branchLocks[branch]
+	if !ok {
+		lock = &sync.Mutex{}
+		c.branchLocks[branch] = lock
 	}
+	return lock
+}
+
+// CheckBranch checks a branch for updates
+func (c *DipaChecker) CheckBranch(branch string, isTestflight bool) error {
+	lock := c.branchLock(branch)
+	lock.Lock()
+	defer lock.Unlock()
+	
+	log.Printf("Checking %s branch...", branch)
 	
 	// Ensure branch exists in hash structure
+	c.mu.Lock()
 	branchData, ok := c.BranchData.Branches[branch]
+	c.mu.Unlock()
 	if !ok {
 		branchData = BranchData{
 			Hash:      "",
@@ -323,22 +558,66 @@ func (c *DipaChecker) CheckBranch(branch string) error {
 		}
 	}
 	
+	listing, err := c.FetchIPAList(branch, branchData)
+	if err != nil {
+		return fmt.Errorf("error fetching IPA list: %w", err)
+	}
+	
+	if listing.NotModified {
+		log.Printf("No changes detected in %s (not modified)", branch)
+		return nil
+	}
+	
+	currentHash := listing.Hash
 	storedHash := branchData.Hash
 	
 	if currentHash != storedHash {
+		files, err := listing.Files()
+		if err != nil {
+			return fmt.Errorf("error parsing IPA list: %w", err)
+		}
+		
+		// A hash stored in the legacy format for the same listing is not a
+		// new version, carry it over instead of dispatching again
+		if storedHash != "" {
+			if legacyHash, err := legacyListingHash(files); err == nil && legacyHash == storedHash {
+				c.mu.Lock()
+				branchData.Hash = currentHash
+				branchData.ETag = listing.ETag
+				branchData.LastModified = listing.LastModified
+				if dispatched, ok := branchData.Dispatches[storedHash]; ok {
+					branchData.Dispatches[currentHash] = dispatched
+					delete(branchData.Dispatches, storedHash)
+				}
+				c.BranchData.Branches[branch] = branchData
+				err := c.SaveHashes()
+				c.mu.Unlock()
+				
+				if err != nil {
+					return fmt.Errorf("error saving hashes: %w", err)
+				}
+				
+				log.Printf("Migrated stored hash for %s, no changes detected", branch)
+				return nil
+			}
+		}
+		
 		latestVersion := c.GetLatestVersion(files)
 		if latestVersion != nil {
-			finalURL := fmt.Sprintf("%s/%s/%s", c.Config.IPABaseURL, branch, latestVersion.Name)
+			finalURL := listing.URL + latestVersion.Name
 			log.Printf("New version found in %s: %s", branch, finalURL)
 			
-			successful, failed, err := c.DispatchGitHubWorkflow(finalURL, branch, currentHash)
+			successful, failed, err := c.DispatchGitHubWorkflow(finalURL, branch, isTestflight, currentHash)
 			if err != nil {
 				return fmt.Errorf("error dispatching workflow: %w", err)
 			}
 			
 			// Update hash and dispatched repositories if there are successful dispatches
 			if len(successful) > 0 {
+				c.mu.Lock()
 				branchData.Hash = currentHash
+				branchData.ETag = listing.ETag
+				branchData.LastModified = listing.LastModified
 				
 				// Initialize dispatches map if needed
 				if branchData.Dispatches == nil {
@@ -350,27 +629,33 @@ func (c *DipaChecker) CheckBranch(branch string) error {
 					branchData.Dispatches[currentHash] = []string{}
 				}
 				
-				// Add successful dispatches to the list
+				// Add successful dispatches to the list, sorted for stable diffs of the hash file
 				existingDispatches := branchData.Dispatches[currentHash]
+				seen := make(map[string]bool, len(existingDispatches))
+				for _, repo := range existingDispatches {
+					seen[repo] = true
+				}
 				for _, repo := range successful {
-					// Check if repo is already in the list
-					found := false
-					for _, existing := range existingDispatches {
-						if existing == repo {
-							found = true
-							break
-						}
-					}
-					
-					if !found {
+					if !seen[repo] {
+						seen[repo] = true
 						existingDispatches = append(existingDispatches, repo)
 					}
 				}
+				sort.Strings(existingDispatches)
 				
 				branchData.Dispatches[currentHash] = existingDispatches
+				
+				// Dispatch records of previous hashes are no longer needed
+				for hash := range branchData.Dispatches {
+					if hash != currentHash {
+						delete(branchData.Dispatches, hash)
+					}
+				}
 				c.BranchData.Branches[branch] = branchData
+				err := c.SaveHashes()
+				c.mu.Unlock()
 				
-				if err := c.SaveHashes(); err != nil {
+				if err != nil {
 					return fmt.Errorf("error saving hashes: %w", err)
 				}
 				
@@ -384,6 +669,21 @@ func (c *DipaChecker) CheckBranch(branch string) error {
 			}
 		}
 	} else {
+		// Same content under new validators, remember them so the next
+		// poll can be answered with 304
+		if listing.ETag != branchData.ETag || listing.LastModified != branchData.LastModified {
+			c.mu.Lock()
+			branchData.ETag = listing.ETag
+			branchData.LastModified = listing.LastModified
+			c.BranchData.Branches[branch] = branchData
+			err := c.SaveHashes()
+			c.mu.Unlock()
+			
+			if err != nil {
+				return fmt.Errorf("error saving hashes: %w", err)
+			}
+		}
+		
 		log.Printf("No changes detected in %s", branch)
 	}
 	
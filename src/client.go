@@ -0,0 +1,133 @@
+package main
+
+import (
+	"io"
+	"net"
+	"net/http"
+	"strconv"
+	"time"
+)
+
+// userAgent is sent with every request made by the service
+const userAgent = "dipa-auto/1"
+
+// retryStatuses are the response codes that are considered transient
+var retryStatuses = map[int]bool{
+	http.StatusTooManyRequests:    true,
+	http.StatusBadGateway:         true,
+	http.StatusServiceUnavailable: true,
+	http.StatusGatewayTimeout:     true,
+}
+
+// clientTransport sets default headers on outgoing requests and retries
+// requests that fail with a transient error
+type clientTransport struct {
+	base       http.RoundTripper
+	maxRetries int
+	backoff    time.Duration
+}
+
+// newHTTPClient creates the HTTP client shared by all polls and dispatches
+func newHTTPClient() *http.Client {
+	// Keep enough idle connections around so concurrent dispatches to
+	// api.github.com reuse their TLS connections across checks
+	transport := http.DefaultTransport.(*http.Transport).Clone()
+	transport.MaxIdleConns = 32
+	transport.MaxIdleConnsPerHost = 32
+
+	// Fail fast on unreachable or hanging servers instead of waiting for
+	// the overall client timeout
+	transport.DialContext = (&net.Dialer{
+		Timeout:   5 * time.Second,
+		KeepAlive: 30 * time.Second,
+	}).DialContext
+	transport.TLSHandshakeTimeout = 5 * time.Second
+	transport.ResponseHeaderTimeout = 15 * time.Second
+
+	// A custom DialContext disables HTTP/2 unless it is forced, keep it so
+	// concurrent dispatches to api.github.com share one multiplexed connection
+	transport.ForceAttemptHTTP2 = true
+
+	return &http.Client{
+		Timeout: 30 * time.Second,
+		Transport: &clientTransport{
+			base:       transport,
+			maxRetries: 3,
+			backoff:    300 * time.Millisecond,
+		},
+	}
+}
+
+// RoundTrip implements http.RoundTripper
+func (t *clientTransport) RoundTrip(req *http.Request) (*http.Response, error) {
+	// A RoundTripper must not modify the caller's request
+	req = req.Clone(req.Context())
+	if req.Header.Get("User-Agent") == "" {
+		req.Header.Set("User-Agent", userAgent)
+	}
+
+	for attempt := 0; ; attempt++ {
+		resp, err := t.base.RoundTrip(req)
+		if attempt >= t.maxRetries || !t.shouldRetry(req, resp, err) {
+			return resp, err
+		}
+
+		delay := t.backoff << attempt
+		if resp != nil {
+			if retryAfter := parseRetryAfter(resp); retryAfter > delay {
+				delay = retryAfter
+			}
+
+			// Hand the response back when the wait would outlast the
+			// client timeout, the caller sees the real status instead of
+			// a deadline error
+			if deadline, ok := req.Context().Deadline(); ok && time.Until(deadline) <= delay {
+				return resp, nil
+			}
+
+			// Drain the body so the connection can be reused
+			io.Copy(io.Discard, resp.Body)
+			resp.Body.Close()
+		}
+
+		// Rewind the body of requests that carry one
+		if req.GetBody != nil {
+			body, err := req.GetBody()
+			if err != nil {
+				return nil, err
+			}
+			req.Body = body
+		}
+
+		select {
+		case <-req.Context().Done():
+			return nil, req.Context().Err()
+		case <-time.After(delay):
+		}
+	}
+}
+
+// shouldRetry reports whether a request is worth sending again. Connection
+// errors are only retried for GET requests, a POST may already have been
+// processed by the server.
+func (t *clientTransport) shouldRetry(req *http.Request, resp *http.Response, err error) bool {
+	if req.Context().Err() != nil {
+		return false
+	}
+	if err != nil {
+		return req.Method == http.MethodGet
+	}
+	if req.Method == http.MethodPost && req.Body != nil && req.GetBody == nil {
+		return false
+	}
+	return retryStatuses[resp.StatusCode]
+}
+
+// parseRetryAfter returns the delay requested by a Retry-After header in seconds
+func parseRetryAfter(resp *http.Response) time.Duration {
+	seconds, err := strconv.Atoi(resp.Header.Get("Retry-After"))
+	if err != nil || seconds < 0 {
+		return 0
+	}
+	return time.Duration(seconds) * time.Second
+}
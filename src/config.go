@@ -2,6 +2,7 @@ package main
 
 import (
 	"errors"
+	"log"
 	"os"
 	"regexp"
 	"strings"
@@ -15,6 +16,10 @@ type Config struct {
 	IPABaseURL      string   `toml:"ipa_base_url"`
 	RefreshSchedule string   `toml:"refresh_schedule"`
 	Targets         []Target `toml:"targets"`
+	Webhook         Webhook  `toml:"webhook"`
+
+	// schedule is the parsed refresh schedule
+	schedule cron.Schedule
 }
 
 // Target represents a GitHub repository target
@@ -23,6 +28,22 @@ type Target struct {
 	GitHubToken string `toml:"github_token"`
 }
 
+// Webhook represents the optional webhook that triggers checks on upload
+type Webhook struct {
+	ListenAddr string `toml:"listen_addr"`
+	Secret     string `toml:"secret"`
+}
+
+// repoRegex matches GitHub repositories in the 'owner/repo' format, owner
+// names only allow hyphens while repository names may also contain dots and
+// underscores
+var repoRegex = regexp.MustCompile(`^[a-zA-Z0-9-]+/[a-zA-Z0-9._-]+$`)
+
+// tokenRegex matches the known GitHub token formats: classic/app tokens
+// ('ghp_...'), fine-grained personal access tokens ('github_pat_...') and
+// legacy 40 character hex tokens
+var tokenRegex = regexp.MustCompile(`^(gh[pousr]_[a-zA-Z0-9]{36,}|github_pat_[a-zA-Z0-9_]{22,}|[0-9a-f]{40})$`)
+
 // LoadConfig loads the configuration from the specified path
 func LoadConfig(path string) (*Config, error) {
 	if path == "" {
@@ -42,9 +63,28 @@ func LoadConfig(path string) (*Config, error) {
 		return nil, err
 	}
 
+	config.Targets = dedupeTargets(config.Targets)
+
 	return &config, nil
 }
 
+// dedupeTargets removes repeated repositories so each one is only dispatched
+// once per update, GitHub repository names are case-insensitive
+func dedupeTargets(targets []Target) []Target {
+	seen := make(map[string]bool, len(targets))
+	deduped := make([]Target, 0, len(targets))
+	for _, target := range targets {
+		repo := strings.ToLower(target.GitHubRepo)
+		if seen[repo] {
+			log.Printf("Warning: ignoring duplicate target %s, only its first entry is used", target.GitHubRepo)
+			continue
+		}
+		seen[repo] = true
+		deduped = append(deduped, target)
+	}
+	return deduped
+}
+
 // validateConfig validates the configuration
 func validateConfig(config *Config) error {
 	// Validate IPA Base URL
@@ -59,17 +99,17 @@ func validateConfig(config *Config) error {
 	if config.RefreshSchedule == "" {
 		return errors.New("refresh_schedule is required")
 	}
-	_, err := cron.ParseStandard(config.RefreshSchedule)
+	schedule, err := cron.ParseStandard(config.RefreshSchedule)
 	if err != nil {
 		return errors.New("invalid cron expression: " + err.Error())
 	}
+	config.schedule = schedule
 
 	// Validate targets
 	if len(config.Targets) == 0 {
 		return errors.New("at least one target is required")
 	}
 
-	repoRegex := regexp.MustCompile(`^[a-zA-Z0-9-]+/[a-zA-Z0-9-]+$`)
 	for _, target := range config.Targets {
 		if target.GitHubRepo == "" {
 			return errors.New("github_repo is required for all targets")
@@ -80,6 +120,15 @@ func validateConfig(config *Config) error {
 		if target.GitHubToken == "" {
 			return errors.New("github_token is required for all targets")
 		}
+		// Unknown formats are only reported, GitHub may still accept them
+		if !tokenRegex.MatchString(target.GitHubToken) {
+			log.Printf("Warning: github_token for %s doesn't look like a GitHub token", target.GitHubRepo)
+		}
+	}
+
+	// Validate webhook, it is disabled unless listen_addr is set
+	if config.Webhook.ListenAddr != "" && config.Webhook.Secret == "" {
+		return errors.New("webhook secret is required when listen_addr is set")
 	}
 
 	return nil
@@ -0,0 +1,12 @@
+package main
+
+import (
+	"os"
+	"syscall"
+)
+
+// syncFile flushes the file contents to disk, fdatasync skips the metadata
+// flush that a full fsync does
+func syncFile(file *os.File) error {
+	return syscall.Fdatasync(int(file.Fd()))
+}
@@ -0,0 +1,10 @@
+//go:build !linux
+
+package main
+
+import "os"
+
+// syncFile flushes the file contents to disk
+func syncFile(file *os.File) error {
+	return file.Sync()
+}
@@ -1,9 +1,12 @@
 package main
 
 import (
+	"context"
 	"log"
+	"net/http"
 	"os"
 	"os/signal"
+	"sync"
 	"syscall"
 	"time"
 
@@ -31,32 +34,36 @@ func main() {
 	// Define the check function without referencing entryID yet
 	checkFunc := func() {
 		log.Println("Starting scheduled check...")
+		start := time.Now()
 		
-		// Check both branches
-		if err := dipaChecker.CheckBranch("stable"); err != nil {
-			log.Printf("Error checking stable branch: %v", err)
-		}
-		
-		// Add a small delay between checks
-		time.Sleep(5 * time.Second)
-		
-		if err := dipaChecker.CheckBranch("testflight"); err != nil {
-			log.Printf("Error checking testflight branch: %v", err)
+		// Check both branches concurrently
+		var wg sync.WaitGroup
+		for _, branch := range monitoredBranches {
+			wg.Add(1)
+			go func(branch Branch) {
+				defer wg.Done()
+				if err := dipaChecker.CheckBranchWithRetry(branch.Name, branch.IsTestflight); err != nil {
+					log.Printf("Error checking %s branch: %v", branch.Name, err)
+				}
+			}(branch)
 		}
+		wg.Wait()
 		
 		// Log next scheduled run
 		entries := c.Entries()
 		if len(entries) > 0 {
 			nextRun := entries[0].Next
-			log.Printf("Check complete. Next run scheduled at: %s", nextRun.Format(time.RFC1123))
+			log.Printf("Check complete in %s. Next run scheduled at: %s",
+				time.Since(start).Round(time.Millisecond), nextRun.Format(time.RFC1123))
 		}
 	}
 	
-	// Add the function to the scheduler
-	entryID, err := c.AddFunc(cfg.RefreshSchedule, checkFunc)
-	if err != nil {
-		log.Fatalf("Failed to schedule cron job: %v", err)
-	}
+	// A check that is still running (or retrying) skips the next run, this is
+	// shared between scheduled and manually triggered checks
+	checkJob := cron.NewChain(cron.SkipIfStillRunning(cron.DefaultLogger)).Then(cron.FuncJob(checkFunc))
+	
+	// Add the job to the scheduler, reusing the schedule parsed during validation
+	entryID := c.Schedule(cfg.schedule, checkJob)
 	
 	// Start the scheduler
 	c.Start()
@@ -67,13 +74,88 @@ func main() {
 	log.Printf("Scheduler started with cron expression: %s", cfg.RefreshSchedule)
 	log.Printf("Next check scheduled at: %s", nextRun.Format(time.RFC1123))
 
-	// Set up signal handling for graceful shutdown
+	// Checks started outside the scheduler are waited for on shutdown, none
+	// are started once shutdown began
+	var manualChecks sync.WaitGroup
+	var manualMu sync.Mutex
+	shuttingDown := false
+	startManualCheck := func(check func()) {
+		manualMu.Lock()
+		defer manualMu.Unlock()
+		if shuttingDown {
+			return
+		}
+		manualChecks.Add(1)
+		go func() {
+			defer manualChecks.Done()
+			check()
+		}()
+	}
+
+	// Start the webhook server if configured, the schedule stays as fallback
+	var webhookServer *http.Server
+	if cfg.Webhook.ListenAddr != "" {
+		webhookServer = newWebhookServer(cfg.Webhook, func(branch Branch) {
+			startManualCheck(func() {
+				if err := dipaChecker.CheckBranchWithRetry(branch.Name, branch.IsTestflight); err != nil {
+					log.Printf("Error checking %s branch: %v", branch.Name, err)
+				}
+			})
+		})
+		go func() {
+			log.Printf("Webhook listening on %s", cfg.Webhook.ListenAddr)
+			if err := webhookServer.ListenAndServe(); err != nil && err != http.ErrServerClosed {
+				log.Fatalf("Webhook server failed: %v", err)
+			}
+		}()
+	}
+
+	// Set up signal handling for graceful shutdown, manual checks and reloads
 	sigCh := make(chan os.Signal, 1)
-	signal.Notify(sigCh, syscall.SIGINT, syscall.SIGTERM)
+	signal.Notify(sigCh, syscall.SIGINT, syscall.SIGTERM, syscall.SIGUSR1, syscall.SIGHUP)
 
-	// Wait for termination signal
-	<-sigCh
+	// Wait for termination signal, SIGUSR1 triggers an immediate check and
+	// SIGHUP reloads the configuration
+	for sig := range sigCh {
+		if sig == syscall.SIGINT || sig == syscall.SIGTERM {
+			break
+		}
+		
+		if sig == syscall.SIGUSR1 {
+			log.Println("SIGUSR1 received, running check now...")
+			startManualCheck(checkJob.Run)
+			continue
+		}
+		
+		log.Println("SIGHUP received, reloading config...")
+		newCfg, err := LoadConfig("")
+		if err != nil {
+			log.Printf("Failed to reload config, keeping current one: %v", err)
+			continue
+		}
+		dipaChecker.applyConfig(newCfg)
+		c.Remove(entryID)
+		entryID = c.Schedule(newCfg.schedule, checkJob)
+		log.Printf("Config reloaded with cron expression: %s", newCfg.RefreshSchedule)
+		if newCfg.Webhook != cfg.Webhook {
+			log.Println("Webhook settings changed, restart dipa-auto to apply them")
+		}
+	}
 	log.Println("Shutdown signal received, stopping scheduler...")
-	c.Stop()
+	
+	// Cut pending retry waits short, requests in flight still complete
+	manualMu.Lock()
+	shuttingDown = true
+	manualMu.Unlock()
+	dipaChecker.Stop()
+	if webhookServer != nil {
+		ctx, cancel := context.WithTimeout(context.Background(), 5*time.Second)
+		webhookServer.Shutdown(ctx)
+		cancel()
+	}
+	
+	// Let running checks finish so their dispatches are recorded
+	<-c.Stop().Done()
+	manualChecks.Wait()
 	log.Println("dipa-auto stopped")
 }
@@ -0,0 +1,81 @@
+package main
+
+import (
+	"crypto/hmac"
+	"crypto/sha256"
+	"encoding/hex"
+	"encoding/json"
+	"io"
+	"log"
+	"net/http"
+	"strings"
+	"time"
+)
+
+// maxWebhookBodySize limits the size of accepted webhook payloads
+const maxWebhookBodySize = 64 << 10
+
+// webhookPayload represents the body of an IPA update notification
+type webhookPayload struct {
+	Branch string `json:"branch"`
+}
+
+// newWebhookServer creates the HTTP server that triggers a branch check when
+// the IPA host reports a new upload, trigger must not block
+func newWebhookServer(cfg Webhook, trigger func(branch Branch)) *http.Server {
+	mux := http.NewServeMux()
+	mux.HandleFunc("/ipa-updated", func(w http.ResponseWriter, r *http.Request) {
+		if r.Method != http.MethodPost {
+			http.Error(w, "method not allowed", http.StatusMethodNotAllowed)
+			return
+		}
+
+		body, err := io.ReadAll(io.LimitReader(r.Body, maxWebhookBodySize))
+		if err != nil {
+			http.Error(w, "failed to read body", http.StatusBadRequest)
+			return
+		}
+
+		if !validSignature(cfg.Secret, body, r.Header.Get("X-Hub-Signature-256")) {
+			http.Error(w, "invalid signature", http.StatusUnauthorized)
+			return
+		}
+
+		var payload webhookPayload
+		if err := json.Unmarshal(body, &payload); err != nil {
+			http.Error(w, "invalid payload", http.StatusBadRequest)
+			return
+		}
+
+		for _, branch := range monitoredBranches {
+			if branch.Name == payload.Branch {
+				log.Printf("Webhook received for %s branch", branch.Name)
+				trigger(branch)
+				w.WriteHeader(http.StatusAccepted)
+				return
+			}
+		}
+
+		http.Error(w, "unknown branch", http.StatusBadRequest)
+	})
+
+	return &http.Server{
+		Addr:              cfg.ListenAddr,
+		Handler:           mux,
+		ReadHeaderTimeout: 5 * time.Second,
+		ReadTimeout:       10 * time.Second,
+		WriteTimeout:      10 * time.Second,
+	}
+}
+
+// validSignature checks a "sha256=<hex>" HMAC signature of the body
+func validSignature(secret string, body []byte, signature string) bool {
+	sig, err := hex.DecodeString(strings.TrimPrefix(signature, "sha256="))
+	if err != nil || !strings.HasPrefix(signature, "sha256=") {
+		return false
+	}
+
+	mac := hmac.New(sha256.New, []byte(secret))
+	mac.Write(body)
+	return hmac.Equal(sig, mac.Sum(nil))
+}